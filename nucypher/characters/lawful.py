@@ -327,7 +327,7 @@ class Alice(Character, actors.PolicyAuthor):
         # Policy Probationary Period
         # TODO: Remove when the time is right.
         # from nucypher.config.constants import END_OF_POLICIES_PROBATIONARY_PERIOD
-        # if policy.expiration > END_OF_POLICIES_PROBATIONARY_PERIOD:
+        # if policy.expiration.datetime() > END_OF_POLICIES_PROBATIONARY_PERIOD:
         #     raise RuntimeError(f"The requested duration for this policy (until {policy.expiration}) exceeds the "
         #                        f"probationary period ({END_OF_POLICIES_PROBATIONARY_PERIOD}).")
 
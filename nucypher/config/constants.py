@@ -1,9 +1,7 @@
 import os
-from collections import namedtuple
+from datetime import datetime, timezone
 from pathlib import Path
-
-from appdirs import AppDirs
-from maya import MayaDT
+from typing import NamedTuple
 
 import nucypher
 
@@ -18,23 +16,34 @@ NUCYPHER_ENVVAR_STAKING_PROVIDERS_PAGINATION_SIZE_LIGHT_NODE = "NUCYPHER_STAKING
 NUCYPHER_ENVVAR_STAKING_PROVIDERS_PAGINATION_SIZE = "NUCYPHER_STAKING_PROVIDERS_PAGINATION_SIZE"
 
 # Base Filepaths
-NUCYPHER_PACKAGE = Path(nucypher.__file__).parent.resolve()
-BASE_DIR = NUCYPHER_PACKAGE.parent.resolve()
+NUCYPHER_PACKAGE = Path(nucypher.__file__).resolve().parent
+BASE_DIR = NUCYPHER_PACKAGE.parent
 
 # User Application Filepaths
-APP_DIR = AppDirs(nucypher.__title__, nucypher.__author__)
-DEFAULT_CONFIG_ROOT = Path(os.getenv('NUCYPHER_CONFIG_ROOT', default=APP_DIR.user_data_dir))
-USER_LOG_DIR = Path(os.getenv('NUCYPHER_USER_LOG_DIR', default=APP_DIR.user_log_dir))
+# APP_DIR, DEFAULT_CONFIG_ROOT and USER_LOG_DIR are resolved on first access (see __getattr__ below)
+_USER_APPLICATION_DIRS = {
+    'DEFAULT_CONFIG_ROOT': ('NUCYPHER_CONFIG_ROOT', 'user_data_dir'),
+    'USER_LOG_DIR': ('NUCYPHER_USER_LOG_DIR', 'user_log_dir'),
+}
 DEFAULT_LOG_FILENAME = "nucypher.log"
 DEFAULT_JSON_LOG_FILENAME = "nucypher.json"
 
+
 # Static Seednodes
-SeednodeMetadata = namedtuple('seednode', ['checksum_address', 'rest_host', 'rest_port'])
+class SeednodeMetadata(NamedTuple):
+    checksum_address: str
+    rest_host: str
+    rest_port: int
+
 
 # Sentry (Add your public key and user ID below)
 NUCYPHER_SENTRY_PUBLIC_KEY = ""
 NUCYPHER_SENTRY_USER_ID = ""
-NUCYPHER_SENTRY_ENDPOINT = f"https://{NUCYPHER_SENTRY_PUBLIC_KEY}@sentry.io/{NUCYPHER_SENTRY_USER_ID}"
+
+
+def get_sentry_endpoint() -> str:
+    return f"https://{NUCYPHER_SENTRY_PUBLIC_KEY}@sentry.io/{NUCYPHER_SENTRY_USER_ID}"
+
 
 # Web
 CLI_ROOT = NUCYPHER_PACKAGE / "network" / "templates"
@@ -47,4 +56,23 @@ TEMPORARY_DOMAIN_NAME = ":temporary-domain:"  # for use with `--dev` node runtim
 NUCYPHER_EVENTS_THROTTLE_MAX_BLOCKS = 'NUCYPHER_EVENTS_THROTTLE_MAX_BLOCKS'
 
 # Probationary period
-END_OF_POLICIES_PROBATIONARY_PERIOD = MayaDT.from_iso8601('2023-4-20T23:59:59.0Z')
+END_OF_POLICIES_PROBATIONARY_PERIOD = datetime(2023, 4, 20, 23, 59, 59, tzinfo=timezone.utc)
+
+
+def __getattr__(name):
+    # Module-level lazy attributes (PEP 562); appdirs is only imported
+    # when a user application directory is not provided via the environment.
+    if name == 'APP_DIR':
+        from appdirs import AppDirs
+        value = AppDirs(nucypher.__title__, nucypher.__author__)
+    elif name in _USER_APPLICATION_DIRS:
+        envvar, app_dir_attribute = _USER_APPLICATION_DIRS[name]
+        path = os.getenv(envvar)
+        if path is None:
+            app_dir = globals().get('APP_DIR') or __getattr__('APP_DIR')
+            path = getattr(app_dir, app_dir_attribute)
+        value = Path(path)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
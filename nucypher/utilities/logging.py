@@ -3,6 +3,7 @@
 
 import pathlib
 from contextlib import contextmanager
+from typing import Optional
 
 from twisted.logger import (
     FileLogObserver,
@@ -19,8 +20,8 @@ import nucypher
 from nucypher.config.constants import (
     DEFAULT_JSON_LOG_FILENAME,
     DEFAULT_LOG_FILENAME,
-    NUCYPHER_SENTRY_ENDPOINT,
     USER_LOG_DIR,
+    get_sentry_endpoint,
 )
 
 ONE_MEGABYTE = 1_048_576
@@ -109,7 +110,7 @@ class GlobalLoggerSettings:
         globalLogPublisher.removeObserver(get_json_file_observer())
 
     @classmethod
-    def start_sentry_logging(cls, dsn: str):
+    def start_sentry_logging(cls, dsn: Optional[str] = None):
         _SentryInitGuard.init(dsn)
         globalLogPublisher.addObserver(sentry_observer)
 
@@ -128,7 +129,9 @@ class _SentryInitGuard:
     dsn = None
 
     @classmethod
-    def init(cls, dsn: str = NUCYPHER_SENTRY_ENDPOINT):
+    def init(cls, dsn: Optional[str] = None):
+        if dsn is None:
+            dsn = get_sentry_endpoint()
         if not cls.initialized:
             initialize_sentry(dsn)
         else:
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from nucypher.config import constants
+
+LAZY_USER_APPLICATION_DIRS = ("APP_DIR", "DEFAULT_CONFIG_ROOT", "USER_LOG_DIR")
+
+
+@pytest.fixture(autouse=True)
+def uncached_user_application_dirs():
+    # Drop any previously resolved values so that each test exercises the lazy lookup
+    cached = {name: vars(constants).pop(name) for name in LAZY_USER_APPLICATION_DIRS if name in vars(constants)}
+    yield
+    for name in LAZY_USER_APPLICATION_DIRS:
+        vars(constants).pop(name, None)
+    vars(constants).update(cached)
+
+
+def test_user_application_dirs_from_environment(monkeypatch, tmp_path):
+    config_root, log_dir = tmp_path / "config", tmp_path / "logs"
+    monkeypatch.setenv("NUCYPHER_CONFIG_ROOT", str(config_root))
+    monkeypatch.setenv("NUCYPHER_USER_LOG_DIR", str(log_dir))
+    monkeypatch.delitem(sys.modules, "appdirs", raising=False)
+
+    assert constants.DEFAULT_CONFIG_ROOT == config_root
+    assert constants.USER_LOG_DIR == log_dir
+
+    # appdirs is not needed when the directories are provided via the environment
+    assert "appdirs" not in sys.modules
+    assert "APP_DIR" not in vars(constants)
+
+
+def test_user_application_dirs_default_to_app_dirs(monkeypatch):
+    monkeypatch.delenv("NUCYPHER_CONFIG_ROOT", raising=False)
+    monkeypatch.delenv("NUCYPHER_USER_LOG_DIR", raising=False)
+
+    assert constants.DEFAULT_CONFIG_ROOT == Path(constants.APP_DIR.user_data_dir)
+    assert constants.USER_LOG_DIR == Path(constants.APP_DIR.user_log_dir)
+
+
+def test_unknown_constant_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        _ = constants.NOT_A_NUCYPHER_CONSTANT
@@ -15,10 +15,7 @@ def naive_print_observer(event):
 
 
 def get_json_observer_for_file(logfile):
-    def json_observer(event):
-        observer = jsonFileLogObserver(outFile=logfile)
-        return observer(event)
-    return json_observer
+    return jsonFileLogObserver(outFile=logfile)
 
 
 def expected_processing(string_with_curly_braces):
@@ -27,12 +24,17 @@ def expected_processing(string_with_curly_braces):
     return expected_output
 
 
+# The first 1024 code points, encoded as UTF-8 in a single call
+all_characters = "".join(map(chr, range(1024)))
+all_bytes = all_characters.encode()
+all_bytes_without_curly_braces = all_characters.replace("{", "").replace("}", "").encode()
+
 # Any string without curly braces won't have any problem
 ordinary_strings = (
     "Because there's nothing worse in life than being ordinary.",
     "🍌 🍌 🍌 terracotta 🍌 🍌 🍌 terracotta terracotta 🥧",
     '"You can quote me on this"',
-    f"Some bytes: {b''.join(chr(i).encode() for i in range(1024) if chr(i) not in '{}')}"
+    f"Some bytes: {all_bytes_without_curly_braces}"
 )
 
 # Strings that have curly braces but that appear in groups of even length are considered safe too,
@@ -60,89 +62,119 @@ freaky_format_strings = (  # Including the expected exception and error message
     ("{{{{{}}}}}", KeyError, ""),
     ("{bananas}", KeyError, "bananas"),
     (str({'bananas': '🍌🍌🍌'}), KeyError, "bananas"),
-    (f"Some bytes: {b''.join(chr(i).encode() for i in range(1024))}", KeyError, "|")
+    (f"Some bytes: {all_bytes}", KeyError, "|")
 )
 
+freaky_strings = tuple(string for string, _exception, _exception_message in freaky_format_strings)
+
 # Embrace the quirky!
 acceptable_strings = (*ordinary_strings, *quirky_strings)
 
+# Expected "log_format" values of JSON-logged events, computed once for all test cases
+expected_twisted_json_formats = {string: expected_processing(string.format()) for string in acceptable_strings}
+expected_nucypher_json_formats = {
+    string: expected_processing(string)
+    for string in (*acceptable_strings, *freaky_strings)
+}
+
+
+@pytest.fixture(scope="module")
+def twisted_logger():
+    return TwistedLogger('twisted', observer=naive_print_observer)
+
+
+@pytest.fixture(scope="module")
+def nucypher_logger():
+    return Logger('nucypher-logger', observer=naive_print_observer)
+
+
+@pytest.fixture(scope="module")
+def json_log_file():
+    return StringIO()
+
 
-def test_twisted_logger_doesnt_like_curly_braces(capsys):
-    twisted_logger = TwistedLogger('twisted', observer=naive_print_observer)
-
-    # Normal strings are logged normally
-    for string in acceptable_strings:
-        twisted_logger.info(string)
-        captured = capsys.readouterr()
-        assert string.format() == captured.out
-        assert not captured.err
-
-    # But curly braces are not
-    for string, _exception, exception_message in freaky_format_strings:
-        twisted_logger.info(string)
-        captured = capsys.readouterr()
-        assert string != captured.out
-        assert "Unable to format event" in captured.out
-        assert exception_message in captured.out
-
-
-def test_twisted_json_logger_doesnt_like_curly_braces_either():
-    twisted_logger = TwistedLogger('twisted-json')
-
-    # Normal strings are logged normally
-    for string in acceptable_strings:
-        file = StringIO()
-        twisted_logger.observer = get_json_observer_for_file(file)
-        twisted_logger.info(string)
-        logged_event = file.getvalue()
-        assert '"log_level": {"name": "info"' in logged_event
-        assert f'"log_format": "{expected_processing(string.format())}"' in logged_event
-
-    # But curly braces are not
-    for string, exception, exception_message in freaky_format_strings:
-        file = StringIO()
-        twisted_logger.observer = get_json_observer_for_file(file)
-        with pytest.raises(exception, match=exception_message):
-            twisted_logger.info(string)
-
-
-def test_but_nucypher_logger_is_cool_with_that(capsys):
-    nucypher_logger = Logger('nucypher-logger', observer=naive_print_observer)
-
-    # Normal strings are logged normally
-    for string in acceptable_strings:
-        nucypher_logger.info(string)
-        captured = capsys.readouterr()
-        assert string == captured.out
-        assert not captured.err
-
-    # And curly braces too!
-    for string, _exception, _exception_message in freaky_format_strings:
-        nucypher_logger.info(string)
-        captured = capsys.readouterr()
-        assert "Unable to format event" not in captured.out
-        assert not captured.err
-        assert string == captured.out
-
-
-def test_even_nucypher_json_logger_is_cool():
-
-    nucypher_logger = Logger('nucypher-logger-json')
-
-    # Normal strings are logged normally
-    for string in acceptable_strings:
-        file = StringIO()
-        nucypher_logger.observer = get_json_observer_for_file(file)
-        nucypher_logger.info(string)
-        logged_event = file.getvalue()
-        assert '"log_level": {"name": "info"' in logged_event
-        assert f'"log_format": "{expected_processing(string)}"' in logged_event
-
-    # And curly braces too!
-    for string, _exception, _exception_message in freaky_format_strings:
-        file = StringIO()
-        nucypher_logger.observer = get_json_observer_for_file(file)
-        nucypher_logger.info(string)
-        logged_event = file.getvalue()
-        assert '"log_level": {"name": "info"' in logged_event
-        assert f'"log_format": "{expected_processing(string)}"' in logged_event
+@pytest.fixture
+def json_log(json_log_file):
+    json_log_file.seek(0)
+    json_log_file.truncate(0)
+    return json_log_file
+
+
+@pytest.fixture(scope="module")
+def twisted_json_logger(json_log_file):
+    return TwistedLogger('twisted-json', observer=get_json_observer_for_file(json_log_file))
+
+
+@pytest.fixture(scope="module")
+def nucypher_json_logger(json_log_file):
+    return Logger('nucypher-logger-json', observer=get_json_observer_for_file(json_log_file))
+
+
+# Normal strings are logged normally
+@pytest.mark.parametrize("string", acceptable_strings)
+def test_twisted_logger_is_fine_with_acceptable_strings(twisted_logger, capsys, string):
+    twisted_logger.info(string)
+    captured = capsys.readouterr()
+    assert string.format() == captured.out
+    assert not captured.err
+
+
+# But curly braces are not
+@pytest.mark.parametrize(
+    "string,exception_message",
+    [(string, exception_message) for string, _exception, exception_message in freaky_format_strings]
+)
+def test_twisted_logger_doesnt_like_curly_braces(twisted_logger, capsys, string, exception_message):
+    twisted_logger.info(string)
+    captured = capsys.readouterr()
+    assert string != captured.out
+    assert "Unable to format event" in captured.out
+    assert exception_message in captured.out
+
+
+@pytest.mark.parametrize("string", acceptable_strings)
+def test_twisted_json_logger_is_fine_with_acceptable_strings(twisted_json_logger, json_log, string):
+    twisted_json_logger.info(string)
+    logged_event = json_log.getvalue()
+    assert '"log_level": {"name": "info"' in logged_event
+    assert f'"log_format": "{expected_twisted_json_formats[string]}"' in logged_event
+
+
+@pytest.mark.parametrize("string,exception,exception_message", freaky_format_strings)
+def test_twisted_json_logger_doesnt_like_curly_braces_either(twisted_json_logger, string, exception, exception_message):
+    with pytest.raises(exception, match=exception_message):
+        twisted_json_logger.info(string)
+
+
+@pytest.mark.parametrize("string", acceptable_strings)
+def test_nucypher_logger_is_fine_with_acceptable_strings(nucypher_logger, capsys, string):
+    nucypher_logger.info(string)
+    captured = capsys.readouterr()
+    assert string == captured.out
+    assert not captured.err
+
+
+# And curly braces too!
+@pytest.mark.parametrize("string", freaky_strings)
+def test_but_nucypher_logger_is_cool_with_that(nucypher_logger, capsys, string):
+    nucypher_logger.info(string)
+    captured = capsys.readouterr()
+    assert "Unable to format event" not in captured.out
+    assert not captured.err
+    assert string == captured.out
+
+
+@pytest.mark.parametrize("string", acceptable_strings)
+def test_nucypher_json_logger_is_fine_with_acceptable_strings(nucypher_json_logger, json_log, string):
+    nucypher_json_logger.info(string)
+    logged_event = json_log.getvalue()
+    assert '"log_level": {"name": "info"' in logged_event
+    assert f'"log_format": "{expected_nucypher_json_formats[string]}"' in logged_event
+
+
+@pytest.mark.parametrize("string", freaky_strings)
+def test_even_nucypher_json_logger_is_cool(nucypher_json_logger, json_log, string):
+    nucypher_json_logger.info(string)
+    logged_event = json_log.getvalue()
+    assert '"log_level": {"name": "info"' in logged_event
+    assert f'"log_format": "{expected_nucypher_json_formats[string]}"' in logged_event